@@ -1,13 +1,83 @@
+import argparse
+import fcntl
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+INSTANCE_SOCKET_PATH = os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+    f"lsfg-vk-qt-ui-{os.getuid()}.sock"
+)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="lsfg-vk-qt-ui")
+    parser.add_argument("--select", metavar="PROFILE", help="select a profile by app or display name")
+    parser.add_argument("--tray", action="store_true", help="stay in the system tray, open the window on demand")
+    parser.add_argument("--verbose", action="store_true", help="print tray menu timings and memory use to stderr")
+    args, _ = parser.parse_known_args(argv)
+    return vars(args)
+
+def acquire_instance_lock():
+    lock_file = open(INSTANCE_SOCKET_PATH + ".lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+def forward_to_running_instance(options, timeout=2.0):
+    # the running instance may still be starting up and not listening yet
+    deadline = time.monotonic() + timeout
+    message = json.dumps(options).encode() + b"\n"
+    while True:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect(INSTANCE_SOCKET_PATH)
+                sock.sendall(message)
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+if __name__ == "__main__":
+    # settle which instance we are before paying for Qt, so a second launch exits right away
+    OPTIONS = parse_args(sys.argv[1:])
+    INSTANCE_LOCK = acquire_instance_lock()
+    if INSTANCE_LOCK is None:
+        if forward_to_running_instance(OPTIONS):
+            sys.exit(0)
+        print("lsfg-vk-qt-ui is already running but did not respond.", file=sys.stderr)
+        sys.exit(1)
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QPushButton, QLabel, QComboBox,
     QMessageBox, QInputDialog, QSlider, QAbstractButton, QSizePolicy,
-    QSpacerItem
+    QSpacerItem, QSpinBox, QSystemTrayIcon, QMenu, QStyle
 )
-from PySide6.QtCore import Qt, QEasingCurve, QPropertyAnimation, Property, QTimer
-from PySide6.QtGui import QPainter, QBrush, QFontMetrics, QPalette
-import sys
-import os
+from PySide6.QtCore import Qt, QEasingCurve, QPropertyAnimation, Property, QTimer, QObject, Signal, QSize
+from PySide6.QtGui import (
+    QPainter, QBrush, QFontMetrics, QPalette, QIcon, QImage, QImageReader, QPixmap,
+    QAction, QActionGroup
+)
+from PySide6.QtNetwork import QLocalServer
+from collections import OrderedDict
+from contextlib import contextmanager
+import glob
+import hashlib
+import itertools
+import shlex
+import subprocess
+import threading
+import queue
+import re
+import shiboken6
 import toml
 
 CONFIG_PATH = os.getenv("LSFG_CONFIG") or os.path.expanduser("~/.config/lsfg-vk/conf.toml")
@@ -15,23 +85,183 @@ DEFAULT_PROFILE_PATH = os.path.expanduser("~/.config/lsfg-vk-qt-ui/default.toml"
 DEFAULT_PROFILE_NAME = "Default"
 
 DISPLAY_NAMES_PATH = os.path.expanduser("~/.config/lsfg-vk-qt-ui/displaynames.toml")
+ICON_CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "lsfg-vk-qt-ui", "icons")
+ICON_SIZE = 24
+# thumbnails past either limit are deleted, least recently used first
+ICON_CACHE_MAX_BYTES = 8 * 1024 * 1024
+ICON_CACHE_MAX_AGE = 30 * 24 * 3600
+
+STEAM_ROOTS = (
+    "~/.local/share/Steam",
+    "~/.steam/steam",
+    "~/.var/app/com.valvesoftware.Steam/.local/share/Steam",
+)
+INHERITANCE_PATH = os.path.expanduser("~/.config/lsfg-vk-qt-ui/profiles.toml")
+
+@contextmanager
+def config_lock():
+    # advisory lock shared by every process that writes CONFIG_PATH through this app
+    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+    with open(CONFIG_PATH + ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
 
-def load_display_names():
-    if os.path.exists(DISPLAY_NAMES_PATH):
-        return toml.load(DISPLAY_NAMES_PATH)
-    return {}
+class InstanceServer(QObject):
+    arguments_received = Signal(dict)
+
+    def __init__(self, path=INSTANCE_SOCKET_PATH, parent=None):
+        super().__init__(parent)
+        QLocalServer.removeServer(path)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._accept)
+        if not self._server.listen(path):
+            print(f"Failed to listen on {path}: {self._server.errorString()}", file=sys.stderr)
+
+    def _accept(self):
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            # a lambda holding conn here crashes once the socket is torn down, so look it up via sender()
+            conn.readyRead.connect(self._read_sender)
+            conn.disconnected.connect(conn.deleteLater)
+            self._read(conn)
+
+    def _read_sender(self):
+        self._read(self.sender())
+
+    def _read(self, conn):
+        if not conn.canReadLine():
+            return
+        try:
+            options = json.loads(bytes(conn.readLine()).decode())
+        except ValueError:
+            options = None
+        conn.disconnectFromServer()
+        if isinstance(options, dict):
+            self.arguments_received.emit(options)
+
+def dump_toml(data, path):
+    # write next to the target and swap it in, so readers like the lsfg-vk layer never see a partial file
+    path = os.path.realpath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        else:
+            os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, "w") as f:
+            toml.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 def save_display_names(display_names):
-    os.makedirs(os.path.dirname(DISPLAY_NAMES_PATH), exist_ok=True)
-    with open(DISPLAY_NAMES_PATH, "w") as f:
-        toml.dump(display_names, f)
+    dump_toml(display_names, DISPLAY_NAMES_PATH)
+
+def read_config_files():
+    files = {}
+    for name, path in (("default", DEFAULT_PROFILE_PATH), ("inheritance", INHERITANCE_PATH),
+                       ("config", CONFIG_PATH), ("display_names", DISPLAY_NAMES_PATH)):
+        if not os.path.exists(path):
+            files[name] = None
+            continue
+        try:
+            files[name] = toml.load(path)
+        except Exception as e:
+            files[name] = e
+    return files
+
+def write_config_files(snapshot):
+    with config_lock():
+        data = {}
+        if os.path.exists(CONFIG_PATH):
+            try:
+                data = toml.load(CONFIG_PATH)
+            except Exception:
+                pass
+
+        data["game"] = snapshot["games"]
+        dump_toml(data, CONFIG_PATH)
+
+    if snapshot["default"] is not None:
+        dump_toml(snapshot["default"], DEFAULT_PROFILE_PATH)
+
+    save_display_names(snapshot["display_names"])
+    if snapshot["inheritance"] is not None:
+        dump_toml(snapshot["inheritance"], INHERITANCE_PATH)
+
+class IOWorker(QObject):
+    # runs file jobs one at a time off the GUI thread, callbacks are delivered back on the GUI thread
+    finished = Signal(object, object, object)
+    failed = Signal(object, object, object)
+
+    def __init__(self, max_pending=32, parent=None):
+        super().__init__(parent)
+        self._queue = queue.Queue(max_pending)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self.finished.connect(self._deliver)
+        self.failed.connect(self._deliver)
+        self._thread = threading.Thread(target=self._run, name="lsfg-vk-qt-ui-io", daemon=True)
+        self._thread.start()
+
+    def submit(self, job, on_done=None, on_error=None, key=None, owner=None):
+        # jobs sharing a key that have not started yet are replaced, so only the latest save runs.
+        # callbacks are dropped once owner has been deleted, the job itself still runs
+        if key is None:
+            key = next(self._ids)
+        with self._lock:
+            queued = key in self._pending
+            self._pending[key] = (job, on_done, on_error, owner)
+        if queued:
+            return
+        try:
+            # never block the GUI thread, a full queue is reported like any other failed job
+            self._queue.put_nowait(key)
+        except queue.Full:
+            with self._lock:
+                self._pending.pop(key, None)
+            error = RuntimeError("Too many pending file operations, try again.")
+            QTimer.singleShot(0, self, lambda: self._deliver(on_error, error, owner))
+
+    def stop(self):
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            key = self._queue.get()
+            if key is None:
+                return
+            with self._lock:
+                job, on_done, on_error, owner = self._pending.pop(key)
+            try:
+                result = job()
+            except Exception as e:
+                self.failed.emit(on_error, e, owner)
+            else:
+                self.finished.emit(on_done, result, owner)
+
+    def _deliver(self, callback, value, owner=None):
+        if callback is None:
+            return
+        if owner is not None and not shiboken6.isValid(owner):
+            return
+        callback(value)
 
 def ensure_config_exists():
-    config_dir = os.path.dirname(CONFIG_PATH)
-    if not os.path.exists(CONFIG_PATH):
-        os.makedirs(config_dir, exist_ok=True)
-        with open(CONFIG_PATH, "w") as f:
-            f.write("version = 1\n")
+    with config_lock():
+        if not os.path.exists(CONFIG_PATH):
+            dump_toml({"version": 1}, CONFIG_PATH)
 
     default_profile_data = {
         "exe": DEFAULT_PROFILE_NAME,
@@ -44,14 +274,12 @@ def ensure_config_exists():
     }
 
     if not os.path.exists(DEFAULT_PROFILE_PATH):
-        os.makedirs(os.path.dirname(DEFAULT_PROFILE_PATH), exist_ok=True)
-        with open(DEFAULT_PROFILE_PATH, "w") as f:
-            toml.dump(default_profile_data, f)
+        dump_toml(default_profile_data, DEFAULT_PROFILE_PATH)
 
 from PySide6.QtWidgets import QDialog, QLineEdit, QLabel, QVBoxLayout, QDialogButtonBox
 
 class ProfileInputDialog(QDialog):
-    def __init__(self, display_name="", app_name="", parent=None):
+    def __init__(self, display_name="", app_name="", group="", groups=(), parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create Profile")
 
@@ -66,6 +294,14 @@ class ProfileInputDialog(QDialog):
         self.app_name_edit = QLineEdit(app_name)
         self.app_name_edit.setPlaceholderText("App to apply LSFG-VK to")
         layout.addWidget(self.app_name_edit)
+
+        layout.addWidget(QLabel("Group (Optional):"))
+        self.group_combo = QComboBox()
+        self.group_combo.setEditable(True)
+        self.group_combo.addItems([""] + sorted(groups))
+        self.group_combo.setCurrentText(group)
+        self.group_combo.lineEdit().setPlaceholderText("Inherit straight from Default")
+        layout.addWidget(self.group_combo)
         layout.addSpacing(10)
 
         self.list_apps_btn = QPushButton("Add a currently open app")
@@ -90,7 +326,8 @@ class ProfileInputDialog(QDialog):
         self.app_name_edit.setFocus()
 
     def get_inputs(self):
-        return self.display_name_edit.text().strip(), self.app_name_edit.text().strip()
+        return (self.display_name_edit.text().strip(), self.app_name_edit.text().strip(),
+                self.group_combo.currentText().strip())
 
     def list_open_apps(self):
         import subprocess
@@ -248,6 +485,29 @@ class HoverSlider(QSlider):
             self._tooltip_label.adjustSize()
             self._tooltip_label.show()
 
+def multiplier_factor(label):
+    try:
+        return int(label[1:]) if label != "Off" else 1
+    except (TypeError, ValueError):
+        return 1
+
+def suggest_fps_limit(target_fps, multiplier, present_mode="vsync", refresh_rate=0):
+    if present_mode in ("vsync", "mailbox") and refresh_rate:
+        target_fps = min(target_fps, int(refresh_rate))
+    return max(1, int(target_fps) // multiplier_factor(multiplier))
+
+def fps_limit_problem(fps_limit, multiplier, present_mode, refresh_rate=0):
+    if not fps_limit:
+        return ""
+    output = fps_limit * multiplier_factor(multiplier)
+    if not refresh_rate or output <= refresh_rate:
+        return ""
+    if present_mode == "vsync":
+        return f"{fps_limit} fps x {multiplier_factor(multiplier)} = {output} fps, above the {refresh_rate:.0f} Hz display. vsync will hold it back."
+    if present_mode == "mailbox":
+        return f"{fps_limit} fps x {multiplier_factor(multiplier)} = {output} fps, above the {refresh_rate:.0f} Hz display. Extra frames will be dropped."
+    return ""
+
 class GameProfile:
     def __init__(self, exe="", multiplier="Off", flow_scale=1.0,
                  performance_mode=False, hdr_mode=False, exp_mode="vsync",
@@ -278,10 +538,7 @@ class GameProfile:
 
     def to_dict(self) -> dict:
         d = {"exe": self.exe}
-        try:
-            d["multiplier"] = int(self.multiplier[1:]) if self.multiplier != "Off" else 1
-        except:
-            d["multiplier"] = 1
+        d["multiplier"] = multiplier_factor(self.multiplier)
         if self.flow_scale != 1.0:
             d["flow_scale"] = self.flow_scale
         if self.performance_mode:
@@ -296,26 +553,696 @@ class GameProfile:
             d["experimental_fps_limit"] = self.experimental_fps_limit
         return d
 
+    def settings(self) -> dict:
+        # every inheritable value, with "unset" spelled out so it can override a parent
+        return {
+            "multiplier": multiplier_factor(self.multiplier),
+            "flow_scale": self.flow_scale,
+            "performance_mode": self.performance_mode,
+            "hdr_mode": self.hdr_mode,
+            "experimental_present_mode": self.experimental_present_mode,
+            "env": self.env or "",
+            "experimental_fps_limit": self.experimental_fps_limit or 0,
+        }
+
+SETTING_KEYS = tuple(GameProfile().settings())
+
+class ProfileInheritance:
+    # effective settings resolve as Default -> optional group -> profile overrides
+    def __init__(self, default=None):
+        self.default = default or GameProfile().settings()
+        # cleared when Default or profiles.toml could not be read, overrides are then only good for this session
+        self.persistent = True
+        self.groups = {}
+        self.records = {}
+        self._settings_cache = {}
+        self._profile_cache = {}
+
+    def load(self, data):
+        for entry in data.get("group", []):
+            name = entry.get("name")
+            if name:
+                self.groups[name] = {k: v for k, v in entry.items() if k in SETTING_KEYS}
+        for entry in data.get("profile", []):
+            exe = entry.get("exe")
+            if exe:
+                self.records[exe] = {k: v for k, v in entry.items() if k in SETTING_KEYS or k == "group"}
+        self._invalidate()
+
+    def to_dict(self) -> dict:
+        used = {record.get("group") for record in self.records.values()}
+        return {
+            "group": [{"name": name, **overrides} for name, overrides in self.groups.items() if name in used],
+            "profile": [{"exe": exe, **record} for exe, record in self.records.items()],
+        }
+
+    def group_of(self, exe):
+        return self.records.get(exe, {}).get("group", "")
+
+    def members(self, group):
+        return [exe for exe, record in self.records.items() if record.get("group") == group]
+
+    def group_settings(self, group):
+        key = ("group", group)
+        if key not in self._settings_cache:
+            effective = dict(self.default)
+            effective.update(self.groups.get(group, {}))
+            self._settings_cache[key] = effective
+        return self._settings_cache[key]
+
+    def parent_settings(self, exe):
+        group = self.group_of(exe)
+        return self.group_settings(group) if group else self.default
+
+    def settings(self, exe):
+        if exe == DEFAULT_PROFILE_NAME:
+            return self.default
+        key = ("profile", exe)
+        if key not in self._settings_cache:
+            effective = dict(self.parent_settings(exe))
+            effective.update({k: v for k, v in self.records.get(exe, {}).items() if k in SETTING_KEYS})
+            self._settings_cache[key] = effective
+        return self._settings_cache[key]
+
+    def profile(self, exe) -> GameProfile:
+        if exe not in self._profile_cache:
+            self._profile_cache[exe] = GameProfile.from_dict({"exe": exe, **self.settings(exe)})
+        return self._profile_cache[exe]
+
+    def _invalidate(self, exes=None, groups=()):
+        if exes is None:
+            self._settings_cache.clear()
+            self._profile_cache.clear()
+            return
+        for group in groups:
+            self._settings_cache.pop(("group", group), None)
+        for exe in exes:
+            self._settings_cache.pop(("profile", exe), None)
+            self._profile_cache.pop(exe, None)
+
+    def set_default(self, key, value):
+        self.default = {**self.default, key: value}
+        self._invalidate()
+
+    def group_profile(self, group) -> GameProfile:
+        return GameProfile.from_dict({"exe": group, **self.group_settings(group)})
+
+    def set_group_value(self, group, key, value):
+        overrides = self.groups.setdefault(group, {})
+        if self.default.get(key) == value:
+            overrides.pop(key, None)
+        else:
+            overrides[key] = value
+        self._invalidate(self.members(group), groups=[group])
+
+    def set_override(self, exe, key, value):
+        record = self.records.setdefault(exe, {})
+        if self.parent_settings(exe).get(key) == value:
+            record.pop(key, None)
+        else:
+            record[key] = value
+        self._invalidate([exe])
+
+    def absorb(self, exe, settings):
+        # a known profile only refreshes the keys it already overrides, anything else keeps following
+        # its parents even if conf.toml still holds an older resolved value
+        if exe in self.records:
+            for key in [k for k in self.records[exe] if k in SETTING_KEYS]:
+                self.set_override(exe, key, settings.get(key))
+            return
+        self.pin(exe, settings)
+
+    def pin(self, exe, settings):
+        # override whatever differs from the inherited value
+        self.records.setdefault(exe, {})
+        current = self.settings(exe)
+        for key in SETTING_KEYS:
+            if settings.get(key) != current.get(key):
+                self.set_override(exe, key, settings.get(key))
+
+    def set_group(self, exe, group):
+        record = self.records.setdefault(exe, {})
+        if group:
+            record["group"] = group
+            self.groups.setdefault(group, {})
+        else:
+            record.pop("group", None)
+        self._invalidate([exe])
+
+    def rename(self, old_exe, new_exe):
+        self.records[new_exe] = self.records.pop(old_exe, {})
+        self._invalidate([old_exe, new_exe])
+
+    def remove(self, exe):
+        self.records.pop(exe, None)
+        self._invalidate([exe])
+
+def resolve_config_files(files):
+    inheritance = ProfileInheritance()
+    profiles = []
+    problems = []
+    display_names = files["display_names"] if isinstance(files["display_names"], dict) else {}
+
+    default_data = files["default"]
+    if default_data is not None:
+        try:
+            if isinstance(default_data, Exception):
+                raise default_data
+            inheritance.default = GameProfile.from_dict(default_data).settings()
+            profiles.append(inheritance.profile(DEFAULT_PROFILE_NAME))
+        except Exception as e:
+            inheritance.persistent = False
+            problems.append(("critical", f"Failed to load default profile:\n{e}"))
+    else:
+        inheritance.persistent = False
+        problems.append(("warning", "Default profile not found."))
+
+    if files["inheritance"] is not None:
+        try:
+            if isinstance(files["inheritance"], Exception):
+                raise files["inheritance"]
+            inheritance.load(files["inheritance"])
+        except Exception as e:
+            inheritance.persistent = False
+            problems.append(("critical", f"Failed to load profile overrides:\n{e}"))
+
+    if files["config"] is not None:
+        try:
+            data = files["config"]
+            if isinstance(data, Exception):
+                raise data
+            game_entries = data.get("game", [])
+            if isinstance(game_entries, dict):
+                game_entries = [game_entries]
+
+            for entry in game_entries:
+                profile = GameProfile.from_dict(entry)
+                if profile.exe != DEFAULT_PROFILE_NAME:
+                    # without a trustworthy Default, keep conf.toml's values exactly and never save them as overrides
+                    if inheritance.persistent:
+                        inheritance.absorb(profile.exe, profile.settings())
+                    else:
+                        inheritance.pin(profile.exe, profile.settings())
+                    profiles.append(inheritance.profile(profile.exe))
+
+            loaded = {p.exe for p in profiles}
+            for exe in list(inheritance.records):
+                if exe not in loaded:
+                    inheritance.remove(exe)
+
+        except Exception as e:
+            problems.append(("critical", f"Failed to load config file:\n{e}"))
+
+    return inheritance, profiles, display_names, problems
+
+def config_snapshot(profiles, display_names, inheritance):
+    default_profile = next((p for p in profiles if p.exe == DEFAULT_PROFILE_NAME), None)
+    valid_exes = {p.exe for p in profiles if p.exe != DEFAULT_PROFILE_NAME}
+    return {
+        "games": [p.to_dict() for p in profiles if p.exe != DEFAULT_PROFILE_NAME],
+        "default": default_profile.to_dict() if default_profile else None,
+        "display_names": {k: v for k, v in display_names.items() if k in valid_exes},
+        "inheritance": inheritance.to_dict() if inheritance.persistent else None,
+    }
+
+def profile_environment(profile, base=None):
+    env = dict(os.environ if base is None else base)
+    env["LSFG_CONFIG"] = CONFIG_PATH
+    env["LSFG_PROCESS"] = profile.exe
+    if isinstance(profile.env, dict):
+        env.update({str(k): str(v) for k, v in profile.env.items()})
+    elif isinstance(profile.env, str):
+        for item in shlex.split(profile.env):
+            key, sep, value = item.partition("=")
+            if sep:
+                env[key] = value
+    return env
+
+def process_children(pid):
+    children = []
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return children
+    for tid in tasks:
+        try:
+            with open(f"/proc/{pid}/task/{tid}/children") as f:
+                children.extend(int(c) for c in f.read().split())
+        except (OSError, ValueError):
+            pass
+    return children
+
+def process_comm(pid):
+    try:
+        with open(f"/proc/{pid}/comm") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def process_maps_contain(pid, needle):
+    try:
+        with open(f"/proc/{pid}/maps") as f:
+            return needle in f.read()
+    except OSError:
+        return False
+
+def find_running_profile(exes):
+    wanted = {os.path.basename(exe)[:LaunchedProcess.COMM_LENGTH]: exe
+              for exe in exes if exe != DEFAULT_PROFILE_NAME}
+    uid = os.getuid()
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return None
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                if entry.stat().st_uid != uid:
+                    continue
+            except OSError:
+                continue
+            comm = process_comm(entry.name)
+            if comm in wanted:
+                return wanted[comm]
+    return None
+
+def resident_memory_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+class LaunchedProcess:
+    # comm is truncated by the kernel to 15 characters
+    COMM_LENGTH = 15
+    # /proc is scanned on a background thread, so this stays short for accurate load times
+    SCAN_INTERVAL = 0.05
+
+    def __init__(self, profile, command, env=None):
+        self.exe = profile.exe
+        self.command = command
+        self.process = subprocess.Popen(
+            shlex.split(command),
+            env=profile_environment(profile, env),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        self.started = time.monotonic()
+        self.known_pids = {self.process.pid}
+        self.vulkan_load_time = None
+        self.comms = set()
+        self.running = True
+        self._polls = 0
+        self._lock = threading.Lock()
+        self._monitor = None
+        # right after fork the child can still carry our own name until it execs
+        self._own_comm = process_comm(os.getpid())
+
+    @property
+    def comm_matched(self):
+        with self._lock:
+            return os.path.basename(self.exe)[:self.COMM_LENGTH] in self.comms
+
+    def pids(self):
+        # children of exited processes get reparented, so keep walking from every live pid seen last time
+        pending = [pid for pid in self.known_pids if os.path.exists(f"/proc/{pid}")]
+        tree = set()
+        while pending:
+            pid = pending.pop()
+            if pid in tree:
+                continue
+            tree.add(pid)
+            pending.extend(process_children(pid))
+        self.known_pids = tree
+        return tree
+
+    def poll(self):
+        self.process.poll()
+        pids = self.pids()
+        if self.process.returncode is not None:
+            pids.discard(self.process.pid)
+
+        comms = set()
+        vulkan_loaded = False
+        for pid in pids:
+            comm = process_comm(pid)
+            if comm and not (pid == self.process.pid and self._polls < 2 and comm == self._own_comm):
+                comms.add(comm)
+            if self.vulkan_load_time is None and not vulkan_loaded:
+                vulkan_loaded = process_maps_contain(pid, "libvulkan")
+
+        with self._lock:
+            self._polls += 1
+            self.comms |= comms
+            if vulkan_loaded:
+                self.vulkan_load_time = time.monotonic() - self.started
+            self.running = bool(pids)
+        return self.running
+
+    def monitor(self):
+        self._monitor = threading.Thread(target=self._watch, name="lsfg-vk-qt-ui-launch", daemon=True)
+        self._monitor.start()
+
+    def _watch(self):
+        while self.poll():
+            time.sleep(self.SCAN_INTERVAL)
+
+    def status(self):
+        with self._lock:
+            running, vulkan_load_time, comms = self.running, self.vulkan_load_time, sorted(self.comms)
+        parts = ["Running" if running else "Exited"]
+        if vulkan_load_time is not None:
+            parts.append(f"Vulkan loaded in {vulkan_load_time:.2f} s")
+        elif running:
+            parts.append("waiting for Vulkan")
+        else:
+            parts.append("Vulkan never loaded")
+        if os.path.basename(self.exe)[:self.COMM_LENGTH] in comms:
+            parts.append("process name matches")
+        elif comms:
+            parts.append(f"process name does not match ({', '.join(comms)})")
+        return " · ".join(parts)
+
+def normalize_app_name(name):
+    name = os.path.basename(name).lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    return re.sub(r"[^a-z0-9]", "", name)
+
+def steam_libraries():
+    libraries = []
+    for root in STEAM_ROOTS:
+        root = os.path.expanduser(root)
+        vdf = os.path.join(root, "steamapps", "libraryfolders.vdf")
+        if not os.path.exists(vdf):
+            continue
+        libraries.append(root)
+        try:
+            with open(vdf) as f:
+                libraries.extend(re.findall(r'"path"\s+"([^"]+)"', f.read()))
+        except OSError:
+            pass
+    # ~/.steam/steam is usually a symlink to one of the others
+    return list(dict.fromkeys(os.path.realpath(path) for path in libraries))
+
+def steam_app_index():
+    apps = []
+    for library in steam_libraries():
+        for manifest in glob.glob(os.path.join(library, "steamapps", "appmanifest_*.acf")):
+            try:
+                with open(manifest, errors="replace") as f:
+                    text = f.read()
+            except OSError:
+                continue
+            fields = {}
+            for key, value in re.findall(r'"(appid|name|installdir)"\s+"([^"]*)"', text):
+                fields.setdefault(key, value)
+            if "appid" not in fields:
+                continue
+            install_path = os.path.join(library, "steamapps", "common", fields.get("installdir", ""))
+            names = {normalize_app_name(fields.get("name", "")), normalize_app_name(fields.get("installdir", ""))}
+            apps.append((fields["appid"], install_path, names - {""}))
+    return apps
+
+def find_steam_appid(exe, apps):
+    key = normalize_app_name(exe)
+    for appid, install_path, names in apps:
+        if key in names or os.path.exists(os.path.join(install_path, exe)):
+            return appid
+    return None
+
+def steam_library_icon(appid):
+    for root in STEAM_ROOTS:
+        cache = os.path.join(os.path.expanduser(root), "appcache", "librarycache")
+        legacy = os.path.join(cache, f"{appid}_icon.jpg")
+        if os.path.exists(legacy):
+            return legacy
+        # newer clients use a folder per app where the icon is the hash-named jpg
+        for path in glob.glob(os.path.join(cache, appid, "*.jpg")):
+            if re.fullmatch(r"[0-9a-f]{40}\.jpg", os.path.basename(path)):
+                return path
+    return None
+
+def icon_theme_dirs():
+    data_home = os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = (os.getenv("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    return [os.path.expanduser("~/.icons")] + [os.path.join(d, "icons") for d in [data_home, *data_dirs] if d]
+
+def find_theme_icon(name, themes, size=ICON_SIZE):
+    candidates = []
+    for base in icon_theme_dirs():
+        for theme in themes:
+            # hicolor style is <size>/apps/<name>, breeze style is apps/<size>/<name>
+            for pattern in ("*/apps/", "apps/*/"):
+                for ext in ("png", "svg"):
+                    candidates.extend(glob.glob(os.path.join(base, theme, pattern + f"{name}.{ext}")))
+    for ext in ("png", "svg"):
+        path = os.path.join("/usr/share/pixmaps", f"{name}.{ext}")
+        if os.path.exists(path):
+            candidates.append(path)
+
+    def icon_size(path):
+        if path.endswith(".svg"):
+            return 1 << 16
+        for part in reversed(path.split(os.sep)[:-1]):
+            digits = part.split("x")[0].split("@")[0]
+            if digits.isdigit():
+                return int(digits)
+        return 0
+
+    # smallest icon that is still big enough, otherwise the biggest there is
+    candidates.sort(key=lambda path: (icon_size(path) < size, abs(icon_size(path) - size)))
+    return candidates[0] if candidates else None
+
+def load_thumbnail(path, size):
+    stat = os.stat(path)
+    key = hashlib.sha1(f"{path}:{stat.st_mtime_ns}:{size}".encode()).hexdigest()
+    cached = os.path.join(ICON_CACHE_DIR, key + ".png")
+    if os.path.exists(cached):
+        image = QImage(cached)
+        if not image.isNull():
+            try:
+                os.utime(cached)
+            except OSError:
+                pass
+            return image
+
+    reader = QImageReader(path)
+    if reader.size().isValid():
+        reader.setScaledSize(reader.size().scaled(size, size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+    image.save(cached)
+    return image
+
+def prune_thumbnail_cache(max_bytes=None, max_age=None):
+    # thumbnails are keyed by the icon's mtime, so updated icons leave stale files behind
+    max_bytes = ICON_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    max_age = ICON_CACHE_MAX_AGE if max_age is None else max_age
+    try:
+        entries = [entry for entry in os.scandir(ICON_CACHE_DIR) if entry.name.endswith(".png")]
+    except OSError:
+        return
+
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort(reverse=True)
+
+    cutoff = time.time() - max_age
+    total = 0
+    for mtime, size, path in files:
+        total += size
+        if total > max_bytes or mtime < cutoff:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+class IconCache(QObject):
+    # icons are found and decoded on a background thread, one at a time, for the rows asked for last
+    icon_loaded = Signal(str)
+
+    def __init__(self, scale=1.0, max_bytes=8 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.scale = scale
+        self.pixel_size = int(ICON_SIZE * scale)
+        self.max_bytes = max_bytes
+        self._pixmaps = OrderedDict()
+        self._bytes = 0
+        self._wanted = []
+        self._loading = None
+        self._themes = [theme for theme in dict.fromkeys((QIcon.themeName(), "hicolor")) if theme]
+        self._steam_apps = None
+        self._worker = IOWorker(parent=self)
+        self._worker.submit(prune_thumbnail_cache)
+
+    def icon(self, exe):
+        if exe not in self._pixmaps:
+            return None
+        self._pixmaps.move_to_end(exe)
+        pixmap = self._pixmaps[exe]
+        return QIcon(pixmap) if pixmap is not None else None
+
+    def request(self, exes):
+        self._wanted = [exe for exe in exes if exe not in self._pixmaps]
+        self._load_next()
+
+    def stop(self):
+        self._worker.stop()
+
+    def _load_next(self):
+        if self._loading is not None:
+            return
+        while self._wanted:
+            exe = self._wanted.pop(0)
+            if exe not in self._pixmaps:
+                break
+        else:
+            return
+
+        self._loading = exe
+        self._worker.submit(lambda: self._load_image(exe),
+                            lambda image: self._loaded(exe, image),
+                            lambda e: self._loaded(exe, None))
+
+    def _load_image(self, exe):
+        path = self._find_icon(exe)
+        return load_thumbnail(path, self.pixel_size) if path else None
+
+    def _find_icon(self, exe):
+        if self._steam_apps is None:
+            self._steam_apps = steam_app_index()
+        appid = find_steam_appid(exe, self._steam_apps)
+
+        names = [f"steam_icon_{appid}"] if appid else []
+        names.append(os.path.splitext(os.path.basename(exe))[0].lower())
+        for name in names:
+            path = find_theme_icon(name, self._themes, self.pixel_size)
+            if path:
+                return path
+        return steam_library_icon(appid) if appid else None
+
+    def _loaded(self, exe, image):
+        self._loading = None
+        pixmap = None
+        if image is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(self.scale)
+        self._store(exe, pixmap)
+        if pixmap is not None:
+            self.icon_loaded.emit(exe)
+        self._load_next()
+
+    def _store(self, exe, pixmap):
+        # misses are remembered too so they are not looked up again, at a token cost
+        self._pixmaps[exe] = pixmap
+        self._bytes += pixmap.width() * pixmap.height() * 4 if pixmap is not None else 64
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= evicted.width() * evicted.height() * 4 if evicted is not None else 64
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, io=None):
         super().__init__()
         self.setWindowTitle("Lossless Scaling Frame Generation")
-        self.resize(900, 520)
+        self.resize(900, 640)
         self.setFixedSize(self.size())
         self.profiles = []
-        self.display_names = load_display_names()
+        self.inheritance = ProfileInheritance()
+        self.display_names = {}
         self.current_index = -1
+        self.loaded = False
+        self.pending_options = None
+        # a shared worker keeps this window's reads and writes ordered with its owner's
+        self.owns_io = io is None
+        self.io = io if io is not None else IOWorker(parent=self)
+        self.icon_cache = IconCache(scale=self.devicePixelRatioF(), parent=self)
+        self.icon_cache.icon_loaded.connect(self.schedule_icon_update)
+        self.icon_rows = set()
+        self.blank_icon = QIcon(self.blank_pixmap())
+        self.icon_timer = QTimer(self)
+        self.icon_timer.setSingleShot(True)
+        self.icon_timer.setInterval(30)
+        self.icon_timer.timeout.connect(self.update_visible_icons)
+        self.launches = []
+        self.launch_commands = {}
+        self.launch_timer = QTimer(self)
+        self.launch_timer.setInterval(200)
+        self.launch_timer.timeout.connect(self.poll_launches)
         self.setCentralWidget(QWidget())
         self.centralWidget().setLayout(self.build_layout())
+        self.centralWidget().setEnabled(False)
         self.load_profiles()
 
-        self.display_names = {}
-        display_path = os.path.expanduser("~/.config/lsfg-vk-qt-ui/displaynames.toml")
-        if os.path.exists(display_path):
-            try:
-                self.display_names = toml.load(display_path)
-            except Exception:
-                self.display_names = {}
+    def closeEvent(self, event):
+        # let queued saves reach the disk before the window goes away
+        if self.owns_io:
+            self.io.stop()
+        self.icon_cache.stop()
+        super().closeEvent(event)
+
+    def blank_pixmap(self):
+        pixmap = QPixmap(int(ICON_SIZE * self.devicePixelRatioF()), int(ICON_SIZE * self.devicePixelRatioF()))
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def schedule_icon_update(self, *args):
+        if not self.icon_timer.isActive():
+            self.icon_timer.start()
+
+    def update_visible_icons(self):
+        count = self.profile_list.count()
+        if count == 0:
+            self.icon_rows.clear()
+            return
+        viewport = self.profile_list.viewport().rect()
+        first = self.profile_list.indexAt(viewport.topLeft()).row()
+        last = self.profile_list.indexAt(viewport.bottomLeft()).row()
+        if first == -1:
+            first = 0
+        if last == -1:
+            last = count - 1
+        visible = set(range(first, min(last, len(self.profiles) - 1) + 1))
+
+        # icons scrolled out of view are dropped so only the LRU cache holds pixmaps
+        for row in self.icon_rows - visible:
+            if row < count:
+                self.profile_list.item(row).setIcon(self.blank_icon)
+
+        for row in sorted(visible):
+            icon = self.icon_cache.icon(self.profiles[row].exe)
+            self.profile_list.item(row).setIcon(icon if icon is not None else self.blank_icon)
+        self.icon_rows = visible
+
+        self.icon_cache.request([self.profiles[row].exe for row in sorted(visible)
+                                 if self.profiles[row].exe != DEFAULT_PROFILE_NAME])
+
+    def load_profiles(self):
+        self.io.submit(read_config_files, self.apply_loaded_profiles,
+                       lambda e: QMessageBox.critical(self, "Error", f"Failed to load config:\n{e}"), owner=self)
+
+    def apply_loaded_profiles(self, files):
+        self.populate_profiles(files)
+        self.loaded = True
+        self.centralWidget().setEnabled(True)
+        self.schedule_icon_update()
 
         default_index = next((i for i, p in enumerate(self.profiles) if p.exe == DEFAULT_PROFILE_NAME), -1)
         if default_index != -1:
@@ -328,77 +1255,32 @@ class MainWindow(QMainWindow):
             self.settings_panel.setEnabled(False)
             self.clear_settings_panel()
 
-    def load_profiles(self):
-        self.profiles.clear()
-        self.profile_list.clear()
-
-        if os.path.exists(DEFAULT_PROFILE_PATH):
-            try:
-                default_data = toml.load(DEFAULT_PROFILE_PATH)
-                default_profile = GameProfile.from_dict(default_data)
-                default_profile.exe = DEFAULT_PROFILE_NAME
-                self.profiles.append(default_profile)
-                self.profile_list.addItem(DEFAULT_PROFILE_NAME)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load default profile:\n{e}")
-        else:
-            QMessageBox.warning(self, "Warning", "Default profile not found.")
+        if self.pending_options:
+            self.handle_args(self.pending_options)
+            self.pending_options = None
 
-        if os.path.exists(CONFIG_PATH):
-            try:
-                data = toml.load(CONFIG_PATH)
-                game_entries = data.get("game", [])
-                if isinstance(game_entries, dict):
-                    game_entries = [game_entries]
+    def populate_profiles(self, files):
+        self.inheritance, self.profiles, self.display_names, problems = resolve_config_files(files)
 
-                for entry in game_entries:
-                    profile = GameProfile.from_dict(entry)
-                    if profile.exe != DEFAULT_PROFILE_NAME:
-                        self.profiles.append(profile)
-                        display_name = self.display_names.get(profile.exe, profile.exe)
-                        self.profile_list.addItem(display_name)
+        self.profile_list.clear()
+        for p in self.profiles:
+            if p.exe == DEFAULT_PROFILE_NAME:
+                self.profile_list.addItem(DEFAULT_PROFILE_NAME)
+            else:
+                self.profile_list.addItem(self.display_names.get(p.exe, p.exe))
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load config file:\n{e}")
+        for level, message in problems:
+            if level == "warning":
+                QMessageBox.warning(self, "Warning", message)
+            else:
+                QMessageBox.critical(self, "Error", message)
 
     def save_profiles(self):
-        try:
-
-            data = {}
-            if os.path.exists(CONFIG_PATH):
-                try:
-                    data = toml.load(CONFIG_PATH)
-                except Exception:
-                    pass
-
-            data["game"] = [p.to_dict() for p in self.profiles if p.exe != DEFAULT_PROFILE_NAME]
-
-            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                toml.dump(data, f)
-
-            default_profile = next((p for p in self.profiles if p.exe == DEFAULT_PROFILE_NAME), None)
-            if default_profile:
-                os.makedirs(os.path.dirname(DEFAULT_PROFILE_PATH), exist_ok=True)
-                with open(DEFAULT_PROFILE_PATH, "w") as f:
-                    toml.dump(default_profile.to_dict(), f)
-                    valid_exes = {p.exe for p in self.profiles if p.exe != DEFAULT_PROFILE_NAME}
-                    display_path = os.path.expanduser("~/.config/lsfg-vk-qt-ui/displaynames.toml")
-                    try:
-                        if os.path.exists(display_path):
-                            current_names = toml.load(display_path)
-                        else:
-                            current_names = {}
-                    except Exception:
-                        current_names = {}
-
-                    cleaned = {k: v for k, v in current_names.items() if k in valid_exes}
-
-                    with open(display_path, "w") as f:
-                        toml.dump(cleaned, f)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save config:\n{e}")
+        if not self.loaded:
+            return
+        snapshot = config_snapshot(self.profiles, self.display_names, self.inheritance)
+        self.io.submit(lambda: write_config_files(snapshot), key="save", owner=self,
+                       on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to save config:\n{e}"))
 
     def build_layout(self):
         root = QVBoxLayout()
@@ -430,7 +1312,10 @@ class MainWindow(QMainWindow):
         layout.addWidget(title)
 
         self.profile_list = QListWidget()
+        self.profile_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+        self.profile_list.setUniformItemSizes(True)
         self.profile_list.clicked.connect(self.profile_selected)
+        self.profile_list.verticalScrollBar().valueChanged.connect(self.schedule_icon_update)
         layout.addWidget(self.profile_list)
 
         btn_layout = QHBoxLayout()
@@ -520,7 +1405,28 @@ class MainWindow(QMainWindow):
         self.real_name_label.setStyleSheet("font-size: 9pt; color: gray; margin-top: 0px;")
         name_layout.addWidget(self.real_name_label)
 
-        layout.addWidget(name_container)
+        launch_container = QWidget()
+        launch_container.setFixedWidth(230)
+        launch_layout = QVBoxLayout(launch_container)
+        launch_layout.setContentsMargins(0, 0, 0, 0)
+        launch_layout.setSpacing(2)
+
+        self.launch_btn = QPushButton("Launch")
+        self.launch_btn.setFixedSize(110, 33)
+        self.launch_btn.setToolTip("Start the app with this profile applied")
+        self.launch_btn.clicked.connect(self.launch_profile)
+        launch_layout.addWidget(self.launch_btn, 0, Qt.AlignRight)
+
+        self.launch_status_label = QLabel()
+        self.launch_status_label.setStyleSheet("font-size: 9pt; color: gray;")
+        self.launch_status_label.setAlignment(Qt.AlignRight)
+        self.launch_status_label.setWordWrap(True)
+        launch_layout.addWidget(self.launch_status_label)
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(name_container, 1)
+        header_layout.addWidget(launch_container, 0, Qt.AlignTop)
+        layout.addLayout(header_layout)
 
         def section_label(text):
             lbl = QLabel(text)
@@ -539,6 +1445,15 @@ class MainWindow(QMainWindow):
             container.setContentsMargins(20, 0, 0, 0)
             return container
 
+        self.scope_exe = None
+        self.scope_combo = QComboBox()
+        self.scope_combo.setFixedSize(245, 36)
+        self.scope_combo.setToolTip("Edit this profile's own settings or the group it inherits from")
+        self.scope_combo.currentIndexChanged.connect(self.scope_changed)
+        self.scope_container = labeled_widget("Editing", self.scope_combo, True)
+        self.scope_container.hide()
+        layout.addWidget(self.scope_container)
+
         layout.addWidget(section_label("Frame Generation"))
 
         self.mode_combo = QComboBox()
@@ -615,42 +1530,182 @@ class MainWindow(QMainWindow):
         self.present_combo.currentTextChanged.connect(self.present_mode_changed)
         layout.addWidget(labeled_widget("Sync mode", self.present_combo, True))
 
+        self.fps_limit_spin = QSpinBox()
+        self.fps_limit_spin.setRange(0, 1000)
+        self.fps_limit_spin.setSpecialValueText("Off")
+        self.fps_limit_spin.setSuffix(" fps")
+        self.fps_limit_spin.setFixedSize(110, 36)
+        self.fps_limit_spin.setToolTip("Caps the base framerate before frame generation")
+        self.fps_limit_spin.valueChanged.connect(self.fps_limit_changed)
+
+        self.fps_target_spin = QSpinBox()
+        self.fps_target_spin.setRange(1, 1000)
+        self.fps_target_spin.setValue(int(self.screen().refreshRate()) or 60)
+        self.fps_target_spin.setSuffix(" fps")
+        self.fps_target_spin.setFixedSize(110, 36)
+        self.fps_target_spin.setToolTip("Output framerate to aim for after frame generation")
+
+        fps_calc_btn = QPushButton("Calculate")
+        fps_calc_btn.setFixedHeight(36)
+        fps_calc_btn.setToolTip("Set the limit from the target and the current mode")
+        fps_calc_btn.clicked.connect(self.calculate_fps_limit)
+
+        fps_container = QWidget()
+        fps_layout = QHBoxLayout(fps_container)
+        fps_layout.setContentsMargins(0, 0, 0, 0)
+        fps_layout.addWidget(self.fps_limit_spin)
+        fps_layout.addWidget(QLabel("Target:"))
+        fps_layout.addWidget(self.fps_target_spin)
+        fps_layout.addWidget(fps_calc_btn)
+        layout.addWidget(labeled_widget("FPS limit", fps_container, True))
+
+        self.fps_hint_label = QLabel()
+        self.fps_hint_label.setStyleSheet("font-size: 9pt; color: gray; margin-left: 32px;")
+        self.fps_hint_label.setWordWrap(True)
+        layout.addWidget(self.fps_hint_label)
+
         panel = QWidget()
         panel.setLayout(layout)
         return panel
 
+    def editing_group(self):
+        if self.current_index == -1 or self.scope_combo.currentIndex() != 1:
+            return ""
+        return self.inheritance.group_of(self.profiles[self.current_index].exe)
+
+    def shown_profile(self):
+        group = self.editing_group()
+        return self.inheritance.group_profile(group) if group else self.profiles[self.current_index]
+
+    def scope_changed(self, index):
+        if self.current_index != -1:
+            self.update_ui()
+
+    def set_setting(self, key, value, exe=None):
+        if exe is None:
+            group = self.editing_group()
+            if group:
+                self.inheritance.set_group_value(group, key, value)
+                self.profiles = [self.inheritance.profile(profile.exe) for profile in self.profiles]
+                return
+            exe = self.profiles[self.current_index].exe
+        if exe == DEFAULT_PROFILE_NAME:
+            self.inheritance.set_default(key, value)
+        else:
+            self.inheritance.set_override(exe, key, value)
+        self.profiles = [self.inheritance.profile(profile.exe) for profile in self.profiles]
+
     def flow_slider_changed(self, value):
         if self.current_index != -1:
-            self.profiles[self.current_index].flow_scale = value / 100.0
+            self.set_setting("flow_scale", value / 100.0)
             self.save_profiles()
 
     def mode_changed(self, text):
         if self.current_index != -1:
-            self.profiles[self.current_index].multiplier = text
+            self.set_setting("multiplier", multiplier_factor(text))
+            self.update_fps_hint()
             self.save_profiles()
 
     def performance_mode_changed(self, checked):
         if self.current_index != -1:
-            self.profiles[self.current_index].performance_mode = checked
+            self.set_setting("performance_mode", checked)
             self.save_profiles()
 
     def hdr_mode_changed(self, checked):
         if self.current_index != -1:
-            self.profiles[self.current_index].hdr_mode = checked
+            self.set_setting("hdr_mode", checked)
             self.save_profiles()
 
     def present_mode_changed(self, text):
         if self.current_index != -1:
-            self.profiles[self.current_index].experimental_present_mode = text
+            self.set_setting("experimental_present_mode", text)
+            self.update_fps_hint()
             self.save_profiles()
 
+    def fps_limit_changed(self, value):
+        if self.current_index != -1:
+            self.set_setting("experimental_fps_limit", value)
+            self.update_fps_hint()
+            self.save_profiles()
+
+    def calculate_fps_limit(self):
+        if self.current_index == -1:
+            return
+        p = self.shown_profile()
+        limit = suggest_fps_limit(self.fps_target_spin.value(), p.multiplier,
+                                  p.experimental_present_mode, self.screen().refreshRate())
+        self.fps_limit_spin.setValue(limit)
+
+    def update_fps_hint(self):
+        if self.current_index == -1:
+            self.fps_hint_label.setText("")
+            return
+        p = self.shown_profile()
+        problem = fps_limit_problem(p.experimental_fps_limit, p.multiplier,
+                                    p.experimental_present_mode, self.screen().refreshRate())
+        if problem:
+            self.fps_hint_label.setText(problem)
+        elif p.experimental_fps_limit:
+            output = p.experimental_fps_limit * multiplier_factor(p.multiplier)
+            self.fps_hint_label.setText(f"Output: {output} fps")
+        else:
+            self.fps_hint_label.setText("")
+
+    def launch_profile(self):
+        if self.current_index == -1:
+            return
+        p = self.profiles[self.current_index]
+        if p.exe == DEFAULT_PROFILE_NAME:
+            QMessageBox.warning(self, "Error", "Select an app profile to launch.")
+            return
+
+        command, ok = QInputDialog.getText(
+            self, "Launch", f'Command to launch "{p.exe}":',
+            text=self.launch_commands.get(p.exe, p.exe)
+        )
+        if not ok or not command.strip():
+            return
+        self.launch_commands[p.exe] = command.strip()
+
+        try:
+            launch = LaunchedProcess(p, command.strip())
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to launch:\n{e}")
+            return
+
+        launch.monitor()
+        self.launches.append(launch)
+        self.launch_timer.start()
+        self.update_launch_status()
+
+    def poll_launches(self):
+        # the launches scan /proc on their own threads, this only refreshes the label
+        if not any(launch.running for launch in self.launches):
+            self.launch_timer.stop()
+        self.update_launch_status()
+
+    def update_launch_status(self):
+        if self.current_index == -1:
+            self.launch_status_label.setText("")
+            self.launch_status_label.setToolTip("")
+            return
+        exe = self.profiles[self.current_index].exe
+        history = [launch for launch in self.launches if launch.exe == exe]
+        self.launch_status_label.setText(history[-1].status() if history else "")
+        self.launch_status_label.setToolTip("\n".join(
+            f"{launch.command}: {launch.vulkan_load_time:.2f} s" if launch.vulkan_load_time is not None
+            else f"{launch.command}: no Vulkan load"
+            for launch in history
+        ))
+
     def create_profile(self):
         default_app_name = ""
         default_display_name = ""
 
-        dlg = ProfileInputDialog(display_name=default_display_name, app_name=default_app_name, parent=self)
+        dlg = ProfileInputDialog(display_name=default_display_name, app_name=default_app_name,
+                                 groups=self.inheritance.groups, parent=self)
         if dlg.exec() == QDialog.Accepted:
-            display_name, app_name = dlg.get_inputs()
+            display_name, app_name, group = dlg.get_inputs()
 
             if not app_name:
                 QMessageBox.warning(self, "Error", "App Name cannot be empty.")
@@ -659,25 +1714,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Error", "Profile already exists or name is reserved.")
                 return
 
-            if os.path.exists(DEFAULT_PROFILE_PATH):
-                try:
-                    default_data = toml.load(DEFAULT_PROFILE_PATH)
-                    new_profile = GameProfile.from_dict(default_data)
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to load Default profile:\n{e}")
-                    new_profile = GameProfile()
-            else:
-                new_profile = GameProfile()
-
-            new_profile.exe = app_name
-            self.profiles.append(new_profile)
+            self.inheritance.set_group(app_name, group)
+            self.profiles.append(self.inheritance.profile(app_name))
 
             self.display_names[app_name] = display_name if display_name else app_name
-            save_display_names(self.display_names)
-
-            self.display_names = load_display_names()
 
             self.profile_list.addItem(display_name if display_name else app_name)
+            self.schedule_icon_update()
             self.profile_list.setCurrentRow(len(self.profiles) - 1)
             self.current_index = len(self.profiles) - 1
 
@@ -691,6 +1734,11 @@ class MainWindow(QMainWindow):
         self.perf_check.setChecked(False)
         self.hdr_check.setChecked(False)
         self.flow_slider.setValue(100)
+        self.fps_limit_spin.setValue(0)
+        self.fps_hint_label.setText("")
+        self.scope_container.hide()
+        self.launch_status_label.setText("")
+        self.launch_status_label.setToolTip("")
 
     def rename_profile(self):
         row = self.profile_list.currentRow()
@@ -702,9 +1750,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Cannot rename the Default profile.")
             return
 
-        dlg = ProfileInputDialog(display_name=self.display_names.get(p.exe, ""), app_name=p.exe, parent=self)
+        dlg = ProfileInputDialog(display_name=self.display_names.get(p.exe, ""), app_name=p.exe,
+                                 group=self.inheritance.group_of(p.exe), groups=self.inheritance.groups, parent=self)
         if dlg.exec() == QDialog.Accepted:
-            new_display_name, new_app_name = dlg.get_inputs()
+            new_display_name, new_app_name, new_group = dlg.get_inputs()
 
             if not new_app_name:
                 QMessageBox.warning(self, "Error", "App Name cannot be empty.")
@@ -714,13 +1763,17 @@ class MainWindow(QMainWindow):
                 return
 
             old_exe = p.exe
-            p.exe = new_app_name
+            if new_app_name != old_exe:
+                self.inheritance.rename(old_exe, new_app_name)
+            self.inheritance.set_group(new_app_name, new_group)
+            self.profiles[row] = self.inheritance.profile(new_app_name)
 
             if old_exe in self.display_names:
                 del self.display_names[old_exe]
             self.display_names[new_app_name] = new_display_name if new_display_name else new_app_name
 
             self.profile_list.item(row).setText(new_display_name if new_display_name else new_app_name)
+            self.schedule_icon_update()
 
             self.update_ui()
             self.save_profiles()
@@ -736,9 +1789,10 @@ class MainWindow(QMainWindow):
         exe_name = self.profiles[row].exe
         if exe_name in self.display_names:
             del self.display_names[exe_name]
-            save_display_names(self.display_names)
+        self.inheritance.remove(exe_name)
         del self.profiles[row]
         self.profile_list.takeItem(row)
+        self.schedule_icon_update()
 
         if self.profiles:
             new_index = min(row, len(self.profiles) - 1)
@@ -753,6 +1807,21 @@ class MainWindow(QMainWindow):
 
         self.save_profiles()
 
+    def handle_args(self, options):
+        name = options.get("select")
+        if name and not self.loaded:
+            self.pending_options = options
+        elif name:
+            index = next((i for i, p in enumerate(self.profiles)
+                          if p.exe == name or self.display_names.get(p.exe) == name), -1)
+            if index != -1:
+                self.profile_list.setCurrentRow(index)
+                self.profile_selected()
+
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def profile_selected(self):
         row = self.profile_list.currentRow()
         if row == -1:
@@ -774,10 +1843,27 @@ class MainWindow(QMainWindow):
 
         if p.exe == DEFAULT_PROFILE_NAME:
             self.real_name_label.setText('Apps added from the add profile button will default to these settings.')
-        elif p.exe != display_name:
-            self.real_name_label.setText(f'App: {p.exe}')
         else:
-            self.real_name_label.setText("")
+            details = []
+            if p.exe != display_name:
+                details.append(f'App: {p.exe}')
+            group = self.inheritance.group_of(p.exe)
+            details.append(f'Inherits from group "{group}"' if group else 'Inherits from Default')
+            self.real_name_label.setText(" · ".join(details))
+
+        group = self.inheritance.group_of(p.exe) if p.exe != DEFAULT_PROFILE_NAME else ""
+        members = len(self.inheritance.members(group)) if group else 0
+        scopes = ["This profile", f'Group "{group}" ({members} app{"s" if members != 1 else ""})'] if group else ["This profile"]
+        # a different profile always starts out editing itself
+        if p.exe != self.scope_exe or [self.scope_combo.itemText(i) for i in range(self.scope_combo.count())] != scopes:
+            self.scope_exe = p.exe
+            self.scope_combo.blockSignals(True)
+            self.scope_combo.clear()
+            self.scope_combo.addItems(scopes)
+            self.scope_combo.blockSignals(False)
+        self.scope_container.setVisible(bool(group))
+
+        p = self.shown_profile()
 
         self.mode_combo.blockSignals(True)
         self.mode_combo.setCurrentText(p.multiplier)
@@ -802,9 +1888,166 @@ class MainWindow(QMainWindow):
         self.flow_slider.setValue(int(p.flow_scale * 100))
         self.flow_slider.blockSignals(False)
 
+        self.fps_limit_spin.blockSignals(True)
+        self.fps_limit_spin.setValue(int(p.experimental_fps_limit or 0))
+        self.fps_limit_spin.blockSignals(False)
+        self.update_fps_hint()
+        self.update_launch_status()
+
+class TrayController(QObject):
+    # keeps only profile data around, MainWindow exists only while it is open
+    def __init__(self, verbose=False, parent=None):
+        super().__init__(parent)
+        self.window = None
+        self.verbose = verbose
+        self.inheritance = ProfileInheritance()
+        self.profiles = []
+        self.display_names = {}
+        self.running_exe = None
+        self.menu_time = 0.0
+        self.io = IOWorker(parent=self)
+
+        icon = QIcon.fromTheme("steam_icon_993090")
+        if icon.isNull():
+            icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
+        self.tray = QSystemTrayIcon(icon, self)
+        self.tray.setToolTip("Lossless Scaling Frame Generation")
+        self.tray.activated.connect(self.tray_activated)
+
+        self.menu = QMenu()
+        self.game_action = self.menu.addAction("")
+        self.game_action.setEnabled(False)
+        self.menu.addSeparator()
+
+        self.multiplier_group = QActionGroup(self)
+        self.multiplier_actions = {}
+        for label in ("Off", "X2", "X3", "X4", "X8"):
+            action = QAction(label, self.multiplier_group)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, label=label: self.apply_setting("multiplier", multiplier_factor(label)))
+            self.menu.addAction(action)
+            self.multiplier_actions[label] = action
+
+        self.performance_action = self.menu.addAction("Performance mode")
+        self.performance_action.setCheckable(True)
+        self.performance_action.triggered.connect(lambda checked: self.apply_setting("performance_mode", checked))
+        self.menu.addSeparator()
+
+        self.menu.addAction("Open").triggered.connect(self.open_window)
+        self.menu.addAction("Quit").triggered.connect(QApplication.quit)
+        self.menu.aboutToShow.connect(self.update_menu)
+        self.tray.setContextMenu(self.menu)
+
+        self.load_profiles()
+
+    def show(self):
+        self.tray.show()
+
+    def load_profiles(self):
+        self.io.submit(read_config_files, self.apply_loaded_profiles)
+
+    def apply_loaded_profiles(self, files):
+        self.inheritance, self.profiles, self.display_names, _ = resolve_config_files(files)
+
+    def current_state(self):
+        # while the window is open it owns the profiles, so read and write through it
+        if self.window is not None and self.window.loaded:
+            return self.window.profiles, self.window.display_names
+        return self.profiles, self.display_names
+
+    def update_menu(self):
+        started = time.perf_counter()
+        profiles, display_names = self.current_state()
+        self.running_exe = find_running_profile(p.exe for p in profiles)
+        profile = next((p for p in profiles if p.exe == self.running_exe), None)
+
+        if profile is None:
+            self.game_action.setText("No profiled app running")
+        else:
+            self.game_action.setText(display_names.get(profile.exe, profile.exe))
+        for label, action in self.multiplier_actions.items():
+            action.setEnabled(profile is not None)
+            action.setChecked(profile is not None and profile.multiplier == label)
+        self.performance_action.setEnabled(profile is not None)
+        self.performance_action.setChecked(profile is not None and profile.performance_mode)
+
+        self.menu_time = time.perf_counter() - started
+        self.report()
+
+    def report(self):
+        if self.verbose:
+            print(f"tray: menu {self.menu_time * 1000:.1f} ms, memory {resident_memory_mb():.0f} MB", file=sys.stderr)
+
+    def apply_setting(self, key, value):
+        exe = self.running_exe
+        if exe is None:
+            return
+
+        if self.window is not None and self.window.loaded:
+            self.window.set_setting(key, value, exe)
+            if self.window.current_index != -1:
+                self.window.update_ui()
+            self.window.save_profiles()
+            return
+
+        self.inheritance.set_override(exe, key, value)
+        self.profiles = [self.inheritance.profile(p.exe) for p in self.profiles]
+        snapshot = config_snapshot(self.profiles, self.display_names, self.inheritance)
+        self.io.submit(lambda: write_config_files(snapshot), key="save",
+                       on_error=lambda e: self.tray.showMessage("Error", f"Failed to save config:\n{e}",
+                                                                QSystemTrayIcon.Critical))
+
+    def tray_activated(self, reason):
+        if reason == QSystemTrayIcon.Trigger:
+            self.open_window()
+
+    def open_window(self):
+        if self.window is None:
+            self.window = MainWindow(io=self.io)
+            self.window.setAttribute(Qt.WA_DeleteOnClose)
+            self.window.destroyed.connect(self.window_closed)
+        self.window.show()
+        self.window.raise_()
+        self.window.activateWindow()
+        return self.window
+
+    def shutdown(self):
+        # app.quit() skips closeEvent, so close the window ourselves and drain the shared worker
+        if self.window is not None:
+            window, self.window = self.window, None
+            window.close()
+        self.io.stop()
+
+    def window_closed(self):
+        # reads queue up behind the window's last writes on the shared worker
+        if self.window is None:
+            return
+        self.window = None
+        self.load_profiles()
+        self.report()
+
+    def handle_args(self, options):
+        self.open_window().handle_args(options)
+
 if __name__ == "__main__":
+    options = OPTIONS
     ensure_config_exists()
     app = QApplication(sys.argv)
-    win = MainWindow()
-    win.show()
+    server = InstanceServer(parent=app)
+
+    if options["tray"] and QSystemTrayIcon.isSystemTrayAvailable():
+        app.setQuitOnLastWindowClosed(False)
+        tray = TrayController(verbose=options["verbose"], parent=app)
+        app.aboutToQuit.connect(tray.shutdown)
+        server.arguments_received.connect(tray.handle_args)
+        tray.show()
+        if options["select"]:
+            tray.handle_args(options)
+    else:
+        if options["tray"]:
+            print("No system tray available, opening the window instead.", file=sys.stderr)
+        win = MainWindow()
+        server.arguments_received.connect(win.handle_args)
+        win.show()
+        win.handle_args(options)
     sys.exit(app.exec())
@@ -0,0 +1,27 @@
+import importlib.util
+import os
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lsfg-vk-qt-ui.py")
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    pytest.importorskip("PySide6")
+    pytest.importorskip("toml")
+    spec = importlib.util.spec_from_file_location("lsfg_vk_qt_ui", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def config_home(app_module, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "CONFIG_PATH", str(tmp_path / "lsfg-vk" / "conf.toml"))
+    monkeypatch.setattr(app_module, "DEFAULT_PROFILE_PATH", str(tmp_path / "ui" / "default.toml"))
+    monkeypatch.setattr(app_module, "DISPLAY_NAMES_PATH", str(tmp_path / "ui" / "displaynames.toml"))
+    monkeypatch.setattr(app_module, "INHERITANCE_PATH", str(tmp_path / "ui" / "profiles.toml"))
+    monkeypatch.setattr(app_module, "ICON_CACHE_DIR", str(tmp_path / "icons"))
+    app_module.ensure_config_exists()
+    return tmp_path
@@ -0,0 +1,27 @@
+import os
+import stat
+
+
+def test_dump_toml_replaces_file_and_keeps_mode(app_module, tmp_path):
+    path = tmp_path / "conf.toml"
+    path.write_text("version = 1\n")
+    os.chmod(path, 0o600)
+
+    app_module.dump_toml({"version": 1, "game": [{"exe": "a", "multiplier": 2}]}, str(path))
+
+    assert app_module.toml.load(str(path))["game"] == [{"exe": "a", "multiplier": 2}]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path) == ["conf.toml"]
+
+
+def test_dump_toml_follows_symlinks(app_module, tmp_path):
+    target = tmp_path / "dotfiles" / "conf.toml"
+    target.parent.mkdir()
+    target.write_text("version = 1\n")
+    link = tmp_path / "conf.toml"
+    link.symlink_to(target)
+
+    app_module.dump_toml({"version": 2}, str(link))
+
+    assert link.is_symlink()
+    assert app_module.toml.load(str(target)) == {"version": 2}
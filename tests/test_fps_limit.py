@@ -0,0 +1,54 @@
+import pytest
+
+
+@pytest.mark.parametrize("multiplier, expected", [("X2", 72), ("X3", 48), ("X4", 36), ("X8", 18)])
+@pytest.mark.parametrize("present_mode", ["vsync", "mailbox"])
+def test_suggestion_is_clamped_to_refresh_rate(app_module, present_mode, multiplier, expected):
+    assert app_module.suggest_fps_limit(240, multiplier, present_mode, 144.0) == expected
+
+
+@pytest.mark.parametrize("multiplier, expected", [("X2", 120), ("X3", 80), ("X4", 60), ("X8", 30)])
+def test_immediate_mode_is_not_clamped(app_module, multiplier, expected):
+    assert app_module.suggest_fps_limit(240, multiplier, "immediate", 144.0) == expected
+
+
+def test_suggestion_without_frame_generation(app_module):
+    assert app_module.suggest_fps_limit(240, "Off", "vsync", 144.0) == 144
+    assert app_module.suggest_fps_limit(240, "Off", "immediate", 144.0) == 240
+
+
+def test_suggestion_never_drops_below_one(app_module):
+    assert app_module.suggest_fps_limit(5, "X8", "immediate") == 1
+
+
+def test_unknown_refresh_rate_skips_clamp(app_module):
+    assert app_module.suggest_fps_limit(240, "X2", "vsync", 0) == 120
+
+
+@pytest.mark.parametrize("present_mode, hint", [("vsync", "vsync will hold it back"),
+                                                ("mailbox", "Extra frames will be dropped")])
+def test_problem_when_output_overshoots_refresh(app_module, present_mode, hint):
+    problem = app_module.fps_limit_problem(80, "X2", present_mode, 144.0)
+    assert "160 fps" in problem
+    assert hint in problem
+
+
+@pytest.mark.parametrize("multiplier", ["X2", "X3", "X4", "X8"])
+def test_no_problem_at_the_suggested_limit(app_module, multiplier):
+    limit = app_module.suggest_fps_limit(240, multiplier, "vsync", 144.0)
+    assert app_module.fps_limit_problem(limit, multiplier, "vsync", 144.0) == ""
+
+
+def test_no_problem_in_immediate_mode(app_module):
+    assert app_module.fps_limit_problem(200, "X4", "immediate", 144.0) == ""
+
+
+def test_no_problem_without_limit_or_refresh_rate(app_module):
+    assert app_module.fps_limit_problem(0, "X2", "vsync", 144.0) == ""
+    assert app_module.fps_limit_problem(None, "X2", "vsync", 144.0) == ""
+    assert app_module.fps_limit_problem(200, "X2", "vsync", 0) == ""
+
+
+def test_off_multiplier_is_compared_directly(app_module):
+    assert app_module.fps_limit_problem(144, "Off", "vsync", 144.0) == ""
+    assert "145 fps x 1 = 145 fps" in app_module.fps_limit_problem(145, "Off", "vsync", 144.0)
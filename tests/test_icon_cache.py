@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+def qt_app(app_module):
+    return app_module.QApplication.instance() or app_module.QApplication([])
+
+
+@pytest.fixture
+def icon_cache(app_module, qt_app, config_home):
+    cache = app_module.IconCache(max_bytes=3 * 16 * 16 * 4 + 64)
+    yield cache
+    cache.stop()
+
+
+def pixmap(app_module, size):
+    image = app_module.QPixmap(size, size)
+    image.fill(app_module.Qt.transparent)
+    return image
+
+
+def test_store_evicts_least_recently_used(app_module, icon_cache):
+    for exe in ("a", "b", "c"):
+        icon_cache._store(exe, pixmap(app_module, 16))
+    icon_cache._store("missing", None)
+    assert icon_cache._bytes == icon_cache.max_bytes
+
+    # a lookup makes "a" the most recently used, so "b" goes first
+    assert icon_cache.icon("a") is not None
+    assert icon_cache.icon("missing") is None
+    icon_cache._store("d", pixmap(app_module, 16))
+    assert list(icon_cache._pixmaps) == ["c", "a", "missing", "d"]
+    assert icon_cache._bytes == icon_cache.max_bytes
+
+    icon_cache._store("e", pixmap(app_module, 16))
+    assert list(icon_cache._pixmaps) == ["a", "missing", "d", "e"]
+
+
+def test_store_keeps_one_icon_larger_than_the_budget(app_module, icon_cache):
+    icon_cache._store("a", pixmap(app_module, 16))
+    icon_cache._store("big", pixmap(app_module, 64))
+
+    assert list(icon_cache._pixmaps) == ["big"]
+    assert icon_cache._bytes == 64 * 64 * 4
+
+
+def write_thumbnail(directory, name, size, age):
+    path = os.path.join(directory, name + ".png")
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_prune_thumbnail_cache_drops_oldest_over_budget(app_module, config_home):
+    os.makedirs(app_module.ICON_CACHE_DIR)
+    for name, age in (("new", 10), ("middle", 20), ("old", 30)):
+        write_thumbnail(app_module.ICON_CACHE_DIR, name, 1000, age)
+    write_thumbnail(app_module.ICON_CACHE_DIR, "stale", 10, 3600)
+
+    app_module.prune_thumbnail_cache(max_bytes=2500, max_age=600)
+
+    assert sorted(os.listdir(app_module.ICON_CACHE_DIR)) == ["middle.png", "new.png"]
+
+
+def test_thumbnail_hit_counts_as_recent_use(app_module, qt_app, config_home, tmp_path):
+    source = str(tmp_path / "icon.png")
+    image = app_module.QImage(48, 48, app_module.QImage.Format_ARGB32)
+    image.fill(0)
+    image.save(source)
+
+    assert app_module.load_thumbnail(source, 24).width() == 24
+    [cached] = os.listdir(app_module.ICON_CACHE_DIR)
+    cached = os.path.join(app_module.ICON_CACHE_DIR, cached)
+    os.utime(cached, (0, 0))
+
+    assert app_module.load_thumbnail(source, 24) is not None
+    app_module.prune_thumbnail_cache(max_age=600)
+    assert os.path.exists(cached)
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def qt_app(app_module):
+    return app_module.QApplication.instance() or app_module.QApplication([])
+
+
+def wait_until(qt_app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the I/O worker"
+        qt_app.processEvents()
+        time.sleep(0.005)
+
+
+def slow_disk(seconds, result=None):
+    def job():
+        time.sleep(seconds)
+        return result
+    return job
+
+
+def test_submit_returns_while_disk_is_slow(app_module, qt_app):
+    worker = app_module.IOWorker()
+    done = []
+
+    started = time.monotonic()
+    worker.submit(slow_disk(0.5, "written"), done.append)
+    assert time.monotonic() - started < 0.05
+
+    # the event loop keeps turning while the job sleeps
+    ticks = 0
+    while not done:
+        qt_app.processEvents()
+        ticks += 1
+        time.sleep(0.005)
+    assert done == ["written"]
+    assert ticks > 10
+    worker.stop()
+
+
+def test_saves_with_the_same_key_collapse_to_latest(app_module, qt_app):
+    worker = app_module.IOWorker()
+    release = threading.Event()
+    written = []
+
+    worker.submit(release.wait)
+    for snapshot in range(5):
+        worker.submit(lambda snapshot=snapshot: written.append(snapshot), key="save")
+    release.set()
+    worker.stop()
+
+    assert written == [4]
+
+
+def test_failed_job_delivers_exception(app_module, qt_app):
+    worker = app_module.IOWorker()
+    errors = []
+
+    def broken_disk():
+        time.sleep(0.05)
+        raise OSError("disk went away")
+
+    worker.submit(broken_disk, on_error=errors.append)
+    wait_until(qt_app, lambda: errors)
+
+    assert isinstance(errors[0], OSError)
+    assert str(errors[0]) == "disk went away"
+    worker.stop()
+
+
+def test_full_queue_fails_instead_of_blocking(app_module, qt_app):
+    worker = app_module.IOWorker(max_pending=1)
+    release = threading.Event()
+    errors = []
+
+    worker.submit(release.wait)
+    wait_until(qt_app, lambda: worker._queue.empty())
+    worker.submit(slow_disk(0))
+
+    started = time.monotonic()
+    worker.submit(slow_disk(0), on_error=errors.append)
+    assert time.monotonic() - started < 0.05
+
+    wait_until(qt_app, lambda: errors)
+    assert isinstance(errors[0], RuntimeError)
+    release.set()
+    worker.stop()
+
+
+def test_callbacks_are_dropped_for_deleted_owner(app_module, qt_app):
+    worker = app_module.IOWorker()
+    owner = app_module.QObject()
+    ran = []
+    delivered = []
+
+    worker.submit(lambda: ran.append(True) or "loaded", delivered.append, owner=owner)
+    app_module.shiboken6.delete(owner)
+    worker.stop()
+    for _ in range(10):
+        qt_app.processEvents()
+
+    assert ran == [True]
+    assert delivered == []
+
+
+def test_main_window_stays_responsive_on_slow_disk(app_module, qt_app, config_home, monkeypatch):
+    load = app_module.toml.load
+    dump = app_module.dump_toml
+
+    def slow_load(*args, **kwargs):
+        time.sleep(0.1)
+        return load(*args, **kwargs)
+
+    def slow_dump(*args, **kwargs):
+        time.sleep(0.3)
+        return dump(*args, **kwargs)
+
+    monkeypatch.setattr(app_module.toml, "load", slow_load)
+    started = time.monotonic()
+    window = app_module.MainWindow()
+    assert time.monotonic() - started < 0.2
+    assert not window.loaded and not window.centralWidget().isEnabled()
+
+    # the event loop keeps turning while the read is in flight, then the window enables itself
+    ticks = 0
+    while not window.loaded:
+        assert time.monotonic() - started < 5
+        qt_app.processEvents()
+        ticks += 1
+        time.sleep(0.005)
+    assert ticks > 10
+    assert window.centralWidget().isEnabled()
+
+    monkeypatch.setattr(app_module, "dump_toml", slow_dump)
+    started = time.monotonic()
+    window.flow_slider.setValue(50)
+    window.mode_combo.setCurrentText("X3")
+    assert time.monotonic() - started < 0.1
+
+    window.io.stop()
+    default = load(app_module.DEFAULT_PROFILE_PATH)
+    assert default["flow_scale"] == 0.5
+    assert default["multiplier"] == 3
+    window.close()
+    window.deleteLater()
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+import pytest
+
+
+def test_tracks_dummy_child_tree(app_module):
+    profile = app_module.GameProfile(exe="sleep")
+    launch = app_module.LaunchedProcess(profile, "sh -c 'sleep 0.3 & wait'")
+
+    seen = set()
+    deadline = time.monotonic() + 5
+    while launch.poll():
+        seen |= launch.known_pids
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+    assert launch.process.pid in seen
+    assert len(seen) >= 2
+    assert {"sh", "sleep"} <= launch.comms
+    assert launch.comm_matched
+    assert not launch.running
+    assert launch.vulkan_load_time is None
+    assert launch.status() == "Exited · Vulkan never loaded · process name matches"
+
+
+def child_that_maps(path, delay):
+    return (f'{sys.executable} -c "import mmap, time; time.sleep({delay}); '
+            f'f = open(\'{path}\', \'rb\'); m = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ); time.sleep(0.3)"')
+
+
+def test_monitor_times_vulkan_load_off_the_caller_thread(app_module, tmp_path):
+    fake_vulkan = tmp_path / "libvulkan.so.1"
+    fake_vulkan.write_bytes(b"\0" * 4096)
+    profile = app_module.GameProfile(exe="python3")
+    launch = app_module.LaunchedProcess(profile, child_that_maps(fake_vulkan, 0.4))
+
+    launch.monitor()
+    deadline = time.monotonic() + 5
+    while launch.running:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+    assert launch.vulkan_load_time == pytest.approx(0.45, abs=0.2)
+    assert "Vulkan loaded in" in launch.status()
+
+
+def test_child_sharing_our_name_still_matches(app_module):
+    name = app_module.process_comm(os.getpid())
+    profile = app_module.GameProfile(exe=name)
+    launch = app_module.LaunchedProcess(profile, f"{sys.executable} -c 'import time; time.sleep(0.3)'")
+    if os.path.basename(sys.executable)[:app_module.LaunchedProcess.COMM_LENGTH] != name:
+        pytest.skip("the test runner's process name differs from its interpreter")
+
+    while launch.poll():
+        time.sleep(0.02)
+
+    assert launch.comm_matched
@@ -0,0 +1,108 @@
+def make_inheritance(app_module):
+    inheritance = app_module.ProfileInheritance(app_module.GameProfile.from_dict({"multiplier": 2}).settings())
+    for exe in ("a", "b", "c"):
+        inheritance.absorb(exe, app_module.GameProfile.from_dict({"exe": exe, "multiplier": 2}).settings())
+    return inheritance
+
+
+def test_group_values_reach_members_only(app_module):
+    inheritance = make_inheritance(app_module)
+    inheritance.set_group("a", "fast")
+    inheritance.set_group("b", "fast")
+    inheritance.profile("c")
+
+    inheritance.set_group_value("fast", "performance_mode", True)
+
+    assert inheritance.profile("a").performance_mode
+    assert inheritance.profile("b").performance_mode
+    assert not inheritance.profile("c").performance_mode
+
+
+def test_profile_override_beats_group_and_default(app_module):
+    inheritance = make_inheritance(app_module)
+    inheritance.set_group("a", "fast")
+    inheritance.set_group_value("fast", "multiplier", 3)
+    inheritance.set_override("a", "multiplier", 4)
+
+    inheritance.set_default("multiplier", 8)
+
+    assert inheritance.profile("a").multiplier == "X4"
+    assert inheritance.profile("b").multiplier == "X8"
+    assert inheritance.records["b"] == {}
+
+
+def test_to_dict_prunes_unused_groups(app_module):
+    inheritance = make_inheritance(app_module)
+    inheritance.set_group("a", "kept")
+    inheritance.set_group("b", "dropped")
+    inheritance.set_group("b", "")
+
+    assert [group["name"] for group in inheritance.to_dict()["group"]] == ["kept"]
+
+
+def load_session(app_module):
+    return app_module.resolve_config_files(app_module.read_config_files())
+
+
+def save_session(app_module, session):
+    inheritance, profiles, display_names, problems = session
+    app_module.write_config_files(app_module.config_snapshot(profiles, display_names, inheritance))
+
+
+def write_games(app_module, *games):
+    app_module.dump_toml({"version": 1, "game": list(games)}, app_module.CONFIG_PATH)
+
+
+def test_round_trip_keeps_records_minimal(app_module, config_home):
+    write_games(app_module, {"exe": "a", "multiplier": 2}, {"exe": "b", "multiplier": 3})
+
+    save_session(app_module, load_session(app_module))
+    inheritance, profiles, _, problems = load_session(app_module)
+
+    assert problems == []
+    assert inheritance.records == {"a": {}, "b": {"multiplier": 3}}
+    assert app_module.toml.load(app_module.INHERITANCE_PATH)["profile"] == [{"exe": "a"}, {"exe": "b", "multiplier": 3}]
+
+
+def test_default_edited_outside_ui_reaches_inheriting_profiles(app_module, config_home):
+    write_games(app_module, {"exe": "a", "multiplier": 2}, {"exe": "b", "multiplier": 3})
+    save_session(app_module, load_session(app_module))
+
+    default = app_module.toml.load(app_module.DEFAULT_PROFILE_PATH)
+    default["multiplier"] = 4
+    app_module.dump_toml(default, app_module.DEFAULT_PROFILE_PATH)
+    inheritance, profiles, _, _ = load_session(app_module)
+    save_session(app_module, (inheritance, profiles, {}, []))
+
+    assert inheritance.records == {"a": {}, "b": {"multiplier": 3}}
+    games = {g["exe"]: g["multiplier"] for g in app_module.toml.load(app_module.CONFIG_PATH)["game"]}
+    assert games == {"a": 4, "b": 3}
+
+
+def test_known_profile_only_refreshes_its_own_overrides(app_module, config_home):
+    write_games(app_module, {"exe": "a", "multiplier": 3})
+    save_session(app_module, load_session(app_module))
+
+    # a hand edit to conf.toml on an overridden key wins, stale values elsewhere keep inheriting
+    write_games(app_module, {"exe": "a", "multiplier": 8, "flow_scale": 0.5})
+    inheritance, _, _, _ = load_session(app_module)
+
+    assert inheritance.records == {"a": {"multiplier": 8}}
+
+
+def test_broken_default_does_not_pin_games(app_module, config_home):
+    write_games(app_module, {"exe": "a", "multiplier": 2}, {"exe": "b", "multiplier": 3})
+    save_session(app_module, load_session(app_module))
+    saved = open(app_module.INHERITANCE_PATH).read()
+
+    with open(app_module.DEFAULT_PROFILE_PATH, "w") as f:
+        f.write("multiplier = = 2\n")
+    session = load_session(app_module)
+    inheritance, profiles, _, problems = session
+    save_session(app_module, session)
+
+    assert problems[0][0] == "critical"
+    assert {p.exe: p.multiplier for p in profiles} == {"a": "X2", "b": "X3"}
+    assert open(app_module.INHERITANCE_PATH).read() == saved
+    games = {g["exe"]: g["multiplier"] for g in app_module.toml.load(app_module.CONFIG_PATH)["game"]}
+    assert games == {"a": 2, "b": 3}
@@ -0,0 +1,67 @@
+import fcntl
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from conftest import APP_PATH
+
+
+def test_second_lock_is_refused(app_module, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "INSTANCE_SOCKET_PATH", str(tmp_path / "instance.sock"))
+
+    first = app_module.acquire_instance_lock()
+    try:
+        assert first is not None
+        assert app_module.acquire_instance_lock() is None
+    finally:
+        first.close()
+
+
+def test_forwarded_options_reach_instance_server(app_module, tmp_path, monkeypatch):
+    qt_app = app_module.QApplication.instance() or app_module.QApplication([])
+    path = str(tmp_path / "instance.sock")
+    monkeypatch.setattr(app_module, "INSTANCE_SOCKET_PATH", path)
+    server = app_module.InstanceServer(path=path)
+    received = []
+    server.arguments_received.connect(received.append)
+
+    assert app_module.forward_to_running_instance({"select": "Some Game", "tray": False})
+
+    deadline = time.monotonic() + 5
+    while not received:
+        assert time.monotonic() < deadline
+        qt_app.processEvents()
+        time.sleep(0.005)
+    assert received == [{"select": "Some Game", "tray": False}]
+
+
+def test_second_launch_forwards_without_importing_qt(tmp_path):
+    path = tmp_path / f"lsfg-vk-qt-ui-{os.getuid()}.sock"
+    lock = open(str(path) + ".lock", "a")
+    fcntl.flock(lock, fcntl.LOCK_EX)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen(1)
+    messages = []
+
+    def accept():
+        conn, _ = listener.accept()
+        with conn:
+            messages.append(conn.makefile().readline())
+    thread = threading.Thread(target=accept)
+    thread.start()
+
+    env = dict(os.environ, XDG_RUNTIME_DIR=str(tmp_path))
+    result = subprocess.run([sys.executable, "-X", "importtime", APP_PATH, "--select", "Default"],
+                            env=env, capture_output=True, text=True, timeout=10)
+    thread.join(5)
+    listener.close()
+    lock.close()
+
+    assert result.returncode == 0
+    assert messages == ['{"select": "Default", "tray": false, "verbose": false}\n']
+    assert "PySide6" not in result.stderr
+    assert "toml" not in result.stderr
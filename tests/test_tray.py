@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def qt_app(app_module):
+    return app_module.QApplication.instance() or app_module.QApplication([])
+
+
+def wait_until(qt_app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        qt_app.processEvents()
+        time.sleep(0.005)
+
+
+def open_and_close(qt_app, tray):
+    from PySide6.QtCore import QEvent
+    window = tray.open_window()
+    wait_until(qt_app, lambda: window.loaded)
+    window.close()
+    qt_app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    wait_until(qt_app, lambda: tray.window is None)
+
+
+def test_shutdown_flushes_pending_window_save(app_module, config_home):
+    qt_app = app_module.QApplication.instance() or app_module.QApplication([])
+    tray = app_module.TrayController()
+    window = tray.open_window()
+    deadline = time.monotonic() + 5
+    while not window.loaded:
+        assert time.monotonic() < deadline
+        qt_app.processEvents()
+
+    # a slow disk keeps the save queued behind it when quit arrives
+    tray.io.submit(lambda: time.sleep(0.2))
+    window.mode_combo.setCurrentText("X4")
+    tray.shutdown()
+
+    assert tray.window is None
+    default = app_module.toml.load(app_module.DEFAULT_PROFILE_PATH)
+    assert default["multiplier"] == 4
+
+
+def test_tray_stays_within_budgets(app_module, qt_app, config_home):
+    games = [{"exe": f"game{i}.exe", "multiplier": 2} for i in range(200)]
+    app_module.dump_toml({"version": 1, "game": games}, app_module.CONFIG_PATH)
+    tray = app_module.TrayController()
+    wait_until(qt_app, lambda: len(tray.profiles) == 201)
+
+    tray.update_menu()
+    assert tray.menu_time < 0.05
+    assert "Menu" not in tray.tray.toolTip()
+
+    # the first window pays for one-off imports and caches, later ones must give their memory back
+    open_and_close(qt_app, tray)
+    baseline = app_module.resident_memory_mb()
+    for _ in range(3):
+        open_and_close(qt_app, tray)
+    assert app_module.resident_memory_mb() - baseline < 15
+    assert not any(isinstance(w, app_module.MainWindow) for w in qt_app.topLevelWidgets())
+
+    tray.shutdown()